@@ -6,7 +6,7 @@
 # all URL endpoints to FLASK functions
 #
 
-from flask import Flask, render_template, session, request, redirect, url_for, flash
+from flask import Flask, render_template, session, request, redirect, url_for, flash, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, login_required, login_user, logout_user, current_user
 from os.path import exists
@@ -33,6 +33,9 @@ login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = "login"
 
+# Maximum number of rooms that may be requested from the rooms API at once
+MAX_API_ROOMS = 100
+
 # Define authentication function to lookup users
 @login_manager.user_loader
 def user_loader(email):
@@ -132,6 +135,49 @@ def room(room_id):
     # Return the room info page
     return render_template('room.html', room=room)
 
+@app.route('/api/rooms')
+def api_rooms():
+    """ Provides an API endpoint which returns the requested fields of several
+    rooms in JSON, e.g. /api/rooms?ids=1,2,3&fields=name,capacity """
+
+    # Parse the comma-separated list of room IDs, dropping duplicates
+    try:
+        ids = [int(i) for i in request.args.get('ids', '').split(',') if i]
+    except ValueError:
+        return jsonify(error="Room IDs must be integers."), 400
+    # Verify that the IDs fit in a 64-bit database integer
+    if any(not -2**63 <= i < 2**63 for i in ids):
+        return jsonify(error="Room IDs must be integers."), 400
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return jsonify(error="Room IDs not specified."), 400
+    if len(ids) > MAX_API_ROOMS:
+        return jsonify(error="At most %d rooms may be requested." % MAX_API_ROOMS), 400
+
+    # Parse the requested fields, defaulting to all fields
+    fields = [i for i in request.args.get('fields', '').split(',') if i]
+    if not fields:
+        fields = list(ROOM_API_COLUMNS)
+    for field in fields:
+        if field not in ROOM_API_COLUMNS:
+            return jsonify(error="Invalid field requested: '%s'." % field), 400
+    columns = room_api_columns(fields)
+
+    # Fetch only the requested columns of all rooms in a single query
+    query = db.session.query(*columns).filter(Room.id.in_(ids))
+    if 'location' in fields:
+        query = query.join(Location, Room.location_id == Location.id)
+    rows = {row._id: row for row in query}
+
+    # Serialize the rooms in the order they were requested
+    rooms = [{field: getattr(rows[i], field) for field in fields}
+             for i in ids if i in rows]
+
+    # Return the JSON response, allowing clients to revalidate with an ETag
+    response = jsonify(rooms)
+    response.add_etag()
+    return response.make_conditional(request)
+
 @app.route('/location/<location_name>')
 def location(location_name):
     """ Displays a listing of rooms in the specified location """
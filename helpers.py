@@ -46,3 +46,21 @@ def create_user(first_name, last_name, email, password):
 
     # Create the new User object
     return User(first_name, last_name, email, pw_hash, salt)
+
+# Maps the field names served by the rooms API to their database columns
+ROOM_API_COLUMNS = {
+    'id': Room.id,
+    'name': Room.name,
+    'description': Room.description,
+    'capacity': Room.capacity,
+    'booking_contact': Room.booking_contact,
+    'booking_email': Room.booking_email,
+    'location': Location.name.label('location')
+}
+
+def room_api_columns(fields):
+    """ Returns the database columns that must be selected to serve the
+    requested rooms API fields """
+
+    # Always select the id so results can be ordered as requested
+    return [Room.id.label('_id')] + [ROOM_API_COLUMNS[field] for field in fields]